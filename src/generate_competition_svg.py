@@ -3,130 +3,325 @@
 Procedurally generates docs/competition.svg for the CS184/284A HW1 rasterizer.
 Output uses only: <polygon>, <texture>, <textri> (no paths/curves).
 Run from repo root: python3 src/generate_competition_svg.py
+
+build_svg() renders this script's scene. build_hw1_svg() renders the scene
+shipped with the hw1 write-up (the committed docs/competition.svg); it is what
+hw1/svg_competition.py runs.
 """
 
 import math
-import os
+from array import array
+from collections.abc import Callable, Iterator, Sequence
+from functools import cache
+from itertools import chain, repeat
+from pathlib import Path
 
 W, H = 800, 800
-CENTER_X, CENTER_Y = W / 2, H / 2
-OUT_PATH = os.path.join(os.path.dirname(__file__), "..", "docs", "competition.svg")
-
-
-def fmt(x: float, y: float) -> str:
-    return f"{x:.4f},{y:.4f}"
+# Resolved once at import: src/ -> repo root -> docs/competition.svg
+OUT_PATH = Path(__file__).resolve().parent.parent / "docs" / "competition.svg"
+# One solid triangle per row of (fill, x0, y0, x1, y1, x2, y2)
+TRIANGLE = '  <polygon fill="%s" points="%.2f,%.2f %.2f,%.2f %.2f,%.2f"/>'
+# Bound %-formatters for an (x, y) pair, a (u, v) pair and a single coordinate
+_FMT_SPACE = "%.2f %.2f".__mod__
+_FMT_UV = "%.3f %.3f".__mod__
+_FMT_COORD = "%.2f".__mod__
+SPIRAL_COLORS = ["#3b82f6", "#8b5cf6", "#ec4899", "#f43f5e", "#f97316", "#eab308", "#22c55e"]
+DIAMOND_COLORS = ["#2a314d", "#3e405a", "#524f66"]
+SKY_COLORS = ("#0a0e1a", "#141c28")  # upper, lower half
+# The shipped competition art (hw1 write-up, docs/competition.svg) keeps its
+# original precision: 4-decimal coordinates and 6-decimal UVs.
+HW1_TRIANGLE = '  <polygon fill="%s" points="%.4f,%.4f %.4f,%.4f %.4f,%.4f"/>'
+HW1_TEXTRI = (
+    '  <textri texid="map" uvs="%.6f %.6f %.6f %.6f %.6f %.6f"'
+    ' points="%.4f %.4f %.4f %.4f %.4f %.4f"/>'
+)
+# Whole document in one template: canvas size (width, height, width, height)
+# followed by the six rendered sections in paint order.
+DOCUMENT = (
+    b'<?xml version="1.0" encoding="utf-8"?>\n'
+    b'<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">\n'
+    b'<svg version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"\n'
+    b'     width="%dpx" height="%dpx" viewBox="0 0 %d %d" xml:space="preserve">\n'
+    b"\n"
+    b'  <texture filename="../svg/texmap/pexels_scene.png" texid="map"/>\n'
+    b"\n"
+    b"%s%s%s%s%s%s"
+    b"</svg>\n"
+)
+# 4 triangles per diamond: center (cx,cy) with points at right, down, left, up.
+# A tile only has six distinct coordinates, so they are formatted once and
+# reused: {0}=cx {1}=cy {2}=cx+half {3}=cy+half {4}=cx-half {5}=cy-half
+DIAMOND_TILE = "\n".join([
+    '  <polygon fill="{fill}" points="{0},{1} {2},{1} {0},{3}"/>',
+    '  <polygon fill="{fill}" points="{0},{1} {0},{3} {4},{1}"/>',
+    '  <polygon fill="{fill}" points="{0},{1} {4},{1} {0},{5}"/>',
+    '  <polygon fill="{fill}" points="{0},{1} {0},{5} {2},{1}"/>',
+])
 
+Point = tuple[float, float]
 
-def fmt_pts(points: list[tuple[float, float]]) -> str:
-    return " ".join(f"{x:.4f},{y:.4f}" for x, y in points)
+# Scene data shared by build_svg() and build_hw1_svg().
+# Hills: fill, ridge line (flat x, y pairs from the left edge) and the ridge
+# height where it meets the right edge; hill_outlines() closes each one.
+HILLS = [
+    ("#1e293b", (0, 420, 120, 380, 280, 400, 450, 360, 600, 390), 370),
+    ("#334155", (0, 520, 200, 460, 400, 500, 550, 450, 720, 480), 440),
+    ("#0f172a", (0, 620, 80, 580, 240, 610, 380, 560, 520, 600, 680, 570), 590),
+]
+ACCENTS: list[tuple[Point, Point, Point, str]] = [
+    ((120, 680), (155, 600), (190, 680), "#4ade80"),
+    ((380, 690), (415, 610), (450, 690), "#38bdf8"),
+    ((600, 685), (635, 615), (670, 685), "#f97316"),
+]
+# Textured panels: top-left corner as a fraction of the canvas, size in px,
+# and the texture window (u0, v0) -> (u1, v1) stretched over the panel.
+PANELS: list[tuple[float, float, float, float, Point, Point]] = [
+    (0.15, 0.58, 220, 160, (0.2, 0.25), (0.55, 0.6)),
+    (0.52, 0.62, 180, 130, (0.5, 0.1), (0.9, 0.5)),
+    (0.68, 0.52, 90, 95, (0.1, 0.6), (0.35, 0.9)),
+]
 
 
 def fmt_pts_space(points: list[tuple[float, float]]) -> str:
-    return " ".join(f"{x:.4f} {y:.4f}" for x, y in points)
+    return " ".join(map(_FMT_SPACE, points))
 
 
-def polygon(fill: str, points: list[tuple[float, float]]) -> str:
-    return f'  <polygon fill="{fill}" points="{fmt_pts(points)}"/>'
+def polygon_flat(fill: str, flat: Sequence[float], pair: str = "%.2f,%.2f") -> str:
+    # flat = x0, y0, x1, y1, ...; formatted in one pass without pairing into tuples
+    pts = " ".join([pair] * (len(flat) // 2)) % tuple(flat)
+    return f'  <polygon fill="{fill}" points="{pts}"/>'
 
 
 def textri(texid: str, uvs: list[tuple[float, float]], points: list[tuple[float, float]]) -> str:
-    uv_str = " ".join(f"{u:.6f} {v:.6f}" for u, v in uvs)
+    uv_str = " ".join(map(_FMT_UV, uvs))
     pt_str = fmt_pts_space(points)
     return f'  <textri texid="{texid}" uvs="{uv_str}" points="{pt_str}"/>'
 
 
-def main() -> None:
-    lines = [
-        '<?xml version="1.0" encoding="utf-8"?>',
-        '<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN" "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">',
-        '<svg version="1.1" xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"',
-        f'     width="{W}px" height="{H}px" viewBox="0 0 {W} {H}" xml:space="preserve">',
-        "",
-        '  <texture filename="../svg/texmap/pexels_scene.png" texid="map"/>',
-        "",
-        "  <!-- Background sky gradient -->",
-        polygon("#0a0e1a", [(0, 0), (W, 0), (0, H / 2)]),
-        polygon("#0a0e1a", [(W, 0), (W, H / 2), (0, H / 2)]),
-        polygon("#141c28", [(0, H / 2), (W, H / 2), (0, H)]),
-        polygon("#141c28", [(W, H / 2), (W, H), (0, H)]),
-        "",
-        "  <!-- Spiral of triangles (geometric antialiasing) -->",
-    ]
-
-    spiral_colors = ["#3b82f6", "#8b5cf6", "#ec4899", "#f43f5e", "#f97316", "#eab308", "#22c55e"]
-    num_arms = 7
-    segments_per_arm = 24
+class TriangleBatch:
+    # Struct-of-arrays triangle store: six packed doubles per triangle in xy
+    # (x0, y0, x1, y1, x2, y2) plus one fill per triangle, so no per-vertex
+    # tuples are kept around until the batch is rendered.
+    def __init__(self) -> None:
+        self.xy = array("d")
+        self.fills: list[str] = []
+
+    def add(self, p0: Point, p1: Point, p2: Point, fill: str) -> None:
+        self.xy.extend((p0[0], p0[1], p1[0], p1[1], p2[0], p2[1]))
+        self.fills.append(fill)
+
+    def render(self, template: str = TRIANGLE) -> list[str]:
+        coords = iter(self.xy)
+        return list(map(template.__mod__, zip(self.fills, *[coords] * 6)))
+
+
+def build_spiral(
+    num_arms: int,
+    segments_per_arm: int,
+    cx: float,
+    cy: float,
+    turns: int = 1,
+    radius: tuple[float, float] = (50, 280),
+    mid_scale: float = 0.85,
+    mid_inset: float = 0.0,
+    spread_arms: bool = False,
+) -> TriangleBatch:
+    cos, sin, pi = math.cos, math.sin, math.pi
+    # radius and angle per vertex: `turns` full turns, radius from radius[0] to
+    # radius[1]. Consecutive wedges share an outer vertex, so compute each one once.
+    r_start, r_span = radius[0], radius[1] - radius[0]
+    t = [i / segments_per_arm for i in range(segments_per_arm + 1)]
+    r = [r_start + r_span * ti for ti in t]
+    sweep = [ti * (2 * turns) * pi for ti in t]
+    # inner point for each wedge, scaled and/or pulled toward the center
+    r_mid = [(r0 + r1) / 2 * mid_scale - mid_inset for r0, r1 in zip(r, r[1:])]
+
+    def wedges(base_angle: float) -> Sequence[float]:
+        a = [base_angle + ai for ai in sweep]
+        a_mid = [(a0 + a1) / 2 for a0, a1 in zip(a, a[1:])]
+        x = [cx + ri * cos(ai) for ri, ai in zip(r, a)]
+        y = [cy + ri * sin(ai) for ri, ai in zip(r, a)]
+        xm = [cx + rm * cos(am) for rm, am in zip(r_mid, a_mid)]
+        ym = [cy + rm * sin(am) for rm, am in zip(r_mid, a_mid)]
+        return array("d", chain.from_iterable(zip(x, y, x[1:], y[1:], xm, ym)))
+
+    # Without spread_arms every arm sweeps the same angles, so one set of wedge
+    # coordinates serves all arms. The arms then coincide and only the last
+    # arm's color is visible; that is the original build_svg art and is kept.
+    shared = None if spread_arms else wedges(0.0)
+    batch = TriangleBatch()
     for arm in range(num_arms):
-        color = spiral_colors[arm % len(spiral_colors)]
-        for i in range(segments_per_arm):
-            t0 = i / segments_per_arm
-            t1 = (i + 1) / segments_per_arm
-            # radius and angle: one full turn, radius from ~50 to ~280
-            r0 = 50 + 230 * t0
-            r1 = 50 + 230 * t1
-            a0 = 2 * math.pi * t0
-            a1 = 2 * math.pi * t1
-            # inner point for wedge (slightly toward center)
-            r_mid = (r0 + r1) / 2 * 0.85
-            a_mid = (a0 + a1) / 2
-            x0 = CENTER_X + r0 * math.cos(a0)
-            y0 = CENTER_Y + r0 * math.sin(a0)
-            x1 = CENTER_X + r1 * math.cos(a1)
-            y1 = CENTER_Y + r1 * math.sin(a1)
-            xm = CENTER_X + r_mid * math.cos(a_mid)
-            ym = CENTER_Y + r_mid * math.sin(a_mid)
-            lines.append(polygon(color, [(x0, y0), (x1, y1), (xm, ym)]))
-
-    lines.extend([
-        "",
-        "  <!-- Tiled diamond pattern -->",
+        batch.xy.extend(shared if shared is not None else wedges(2 * pi * arm / num_arms))
+        batch.fills.extend(repeat(SPIRAL_COLORS[arm % len(SPIRAL_COLORS)], segments_per_arm))
+    return batch
+
+
+def build_diamonds(
+    width: float,
+    height: float,
+    step: float,
+    half: float,
+    cover: float | None = None,
+    coord: Callable[[float], str] = _FMT_COORD,
+) -> list[str]:
+    start = step / 2  # first center
+    row_max = int((height - start) / step) + 2
+    col_max = int((width - start) / step) + 2
+    templates = [DIAMOND_TILE.replace("{fill}", color) for color in DIAMOND_COLORS]
+    tiles: list[str] = []
+    append = tiles.append
+    # Rows and columns are culled up front so the per-tile loop needs no bounds
+    # check. By default tiles stop at the canvas plus one half-cell of bleed;
+    # with `cover`, rows stop at that fraction of the height and columns run
+    # the full grid.
+    if cover is None:
+        rows = min(row_max, int((height + half - start) // step) + 1)
+    else:
+        rows = min(row_max, int(height * cover // step) + 1)
+    for row in range(rows):
+        cy = start + row * step
+        x0 = start + (step / 2 if row % 2 else 0)
+        cols = col_max if cover is not None else min(col_max, int((width + half - x0) // step) + 1)
+        for col in range(cols):
+            cx = x0 + col * step
+            coords = map(coord, (cx, cy, cx + half, cy + half, cx - half, cy - half))
+            append(templates[(row + col) % 3].format(*coords))
+    return tiles
+
+
+def panel_triangles(width: float, height: float) -> Iterator[tuple[list[Point], list[Point]]]:
+    # (uvs, points) per textri; each PANELS quad is split into (0, 1, 2) and (0, 2, 3)
+    for fx, fy, w, h, uv0, uv1 in PANELS:
+        x, y = width * fx, height * fy
+        corners = [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
+        uvs = [uv0, (uv1[0], uv0[1]), uv1, (uv0[0], uv1[1])]
+        for i, j, k in ((0, 1, 2), (0, 2, 3)):
+            yield [uvs[i], uvs[j], uvs[k]], [corners[i], corners[j], corners[k]]
+
+
+def hill_outlines(width: float, height: float) -> Iterator[tuple[str, Sequence[float]]]:
+    # Each ridge is closed along the right edge and the bottom of the canvas
+    for fill, ridge, right_y in HILLS:
+        yield fill, array("d", [*ridge, width, right_y, width, height, 0, height])
+
+
+def accent_batch() -> TriangleBatch:
+    accents = TriangleBatch()
+    for p0, p1, p2, fill in ACCENTS:
+        accents.add(p0, p1, p2, fill)
+    return accents
+
+
+def _section(comment: str, elements: list[str]) -> bytes:
+    # Comment line, one element per line, then a blank separator line
+    return "\n".join([f"  <!-- {comment} -->", *elements, "", ""]).encode("ascii")
+
+
+@cache
+def sky_section(width: int, height: int) -> bytes:
+    return _section("Background sky gradient", [
+        polygon_flat(SKY_COLORS[0], array("d", [0, 0, width, 0, width, height / 2, 0, height / 2])),
+        polygon_flat(SKY_COLORS[1], array("d", [0, height / 2, width, height / 2, width, height, 0, height])),
     ])
-    half = 12.6  # half-cell size
-    step = 28.0  # grid step
-    start = 14.0  # first center
-    diamond_colors = ["#2a314d", "#3e405a", "#524f66"]
-    row_max = int((H - start) / step) + 2
-    col_max = int((W - start) / step) + 2
-    for row in range(row_max):
-        for col in range(col_max):
-            cx = start + col * step + (step / 2 if row % 2 else 0)
-            cy = start + row * step
-            if cx > W + half or cy > H + half:
-                continue
-            color = diamond_colors[(row + col) % 3]
-            # 4 triangles per diamond: center (cx,cy) with points at right, down, left, up
-            lines.append(polygon(color, [(cx, cy), (cx + half, cy), (cx, cy + half)]))
-            lines.append(polygon(color, [(cx, cy), (cx, cy + half), (cx - half, cy)]))
-            lines.append(polygon(color, [(cx, cy), (cx - half, cy), (cx, cy - half)]))
-            lines.append(polygon(color, [(cx, cy), (cx, cy - half), (cx + half, cy)]))
-
-    lines.extend([
-        "",
-        "  <!-- Textured panels (texture antialiasing) -->",
-        textri("map", [(0.2, 0.25), (0.55, 0.25), (0.55, 0.6)], [(120, 464), (340, 464), (340, 624)]),
-        textri("map", [(0.2, 0.25), (0.55, 0.6), (0.2, 0.6)], [(120, 464), (340, 624), (120, 624)]),
-        textri("map", [(0.5, 0.1), (0.9, 0.1), (0.9, 0.5)], [(416, 496), (596, 496), (596, 626)]),
-        textri("map", [(0.5, 0.1), (0.9, 0.5), (0.5, 0.5)], [(416, 496), (596, 626), (416, 626)]),
-        textri("map", [(0.1, 0.6), (0.35, 0.6), (0.35, 0.9)], [(544, 416), (634, 416), (634, 511)]),
-        textri("map", [(0.1, 0.6), (0.35, 0.9), (0.1, 0.9)], [(544, 416), (634, 511), (544, 511)]),
-        "",
-        "  <!-- Stylized hills (layered polygons) -->",
-        polygon("#1e293b", [(0, 420), (120, 380), (280, 400), (450, 360), (600, 390), (W, 370), (W, H), (0, H)]),
-        polygon("#334155", [(0, 520), (200, 460), (400, 500), (550, 450), (720, 480), (W, 440), (W, H), (0, H)]),
-        polygon("#0f172a", [(0, 620), (80, 580), (240, 610), (380, 560), (520, 600), (680, 570), (W, 590), (W, H), (0, H)]),
-        "",
-        "  <!-- Foreground accent triangles -->",
-        polygon("#4ade80", [(120, 680), (155, 600), (190, 680)]),
-        polygon("#38bdf8", [(380, 690), (415, 610), (450, 690)]),
-        polygon("#f97316", [(600, 685), (635, 615), (670, 685)]),
-        "",
-        "</svg>",
+
+
+@cache
+def spiral_section(width: int, height: int) -> bytes:
+    spiral = build_spiral(7, 24, width / 2, height / 2)
+    return _section("Spiral of triangles (geometric antialiasing)", spiral.render())
+
+
+@cache
+def diamond_section(width: int, height: int) -> bytes:
+    tiles = build_diamonds(width, height, step=28.0, half=12.6)
+    return _section("Tiled diamond pattern", tiles)
+
+
+@cache
+def panel_section(width: int, height: int) -> bytes:
+    return _section("Textured panels (texture antialiasing)", [
+        textri("map", uvs, points) for uvs, points in panel_triangles(width, height)
     ])
 
-    out_dir = os.path.dirname(OUT_PATH)
-    os.makedirs(out_dir, exist_ok=True)
-    with open(OUT_PATH, "w") as f:
-        f.write("\n".join(lines))
+
+@cache
+def hill_section(width: int, height: int) -> bytes:
+    return _section("Stylized hills (layered polygons)", [
+        polygon_flat(fill, outline) for fill, outline in hill_outlines(width, height)
+    ])
+
+
+@cache
+def accent_section() -> bytes:
+    return _section("Foreground accent triangles", accent_batch().render())
+
+
+@cache
+def hw1_sections(width: int, height: int) -> tuple[bytes, ...]:
+    # Sky, spiral, diamonds, panels, hills, accents in paint order
+    sky = TriangleBatch()
+    sky.add((0, 0), (width, 0), (0, height * 0.5), SKY_COLORS[0])
+    sky.add((width, 0), (width, height * 0.5), (0, height * 0.5), SKY_COLORS[0])
+    sky.add((0, height * 0.5), (width, height * 0.5), (0, height), SKY_COLORS[1])
+    sky.add((width, height * 0.5), (width, height), (0, height), SKY_COLORS[1])
+    spiral = build_spiral(
+        7, 24, width * 0.5, height * 0.45,
+        turns=2, radius=(40, 260), mid_scale=1.0, mid_inset=15, spread_arms=True,
+    )
+    diamonds = build_diamonds(width, height, step=28.0, half=28 * 0.45, cover=0.7, coord="%.4f".__mod__)
+    return (
+        _section("Background sky gradient", sky.render(HW1_TRIANGLE)),
+        _section("Spiral of triangles (geometric antialiasing)", spiral.render(HW1_TRIANGLE)),
+        _section("Tiled diamond pattern", diamonds),
+        _section("Textured panel (texture antialiasing)", [
+            HW1_TEXTRI % (*chain(*uvs), *chain(*points)) for uvs, points in panel_triangles(width, height)
+        ]),
+        _section("Stylized hills (layered polygons)", [
+            polygon_flat(fill, outline, pair="%.0f,%.0f") for fill, outline in hill_outlines(width, height)
+        ]),
+        _section("Foreground accent triangles", accent_batch().render(HW1_TRIANGLE)),
+    )
+
+
+def _write(out_path: str | Path, document: bytes) -> None:
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("wb") as f:
+        f.write(document)
+
+
+def build_svg(out_path: str | Path = OUT_PATH, width: int = W, height: int = H) -> None:
+    # Sections are independent of each other; they are written in paint order.
+    # Every section is deterministic for a given canvas size, so each one is
+    # rendered and encoded once and later builds only copy cached bytes.
+    _write(out_path, DOCUMENT % (
+        width, height, width, height,
+        sky_section(width, height),
+        spiral_section(width, height),
+        diamond_section(width, height),
+        panel_section(width, height),
+        hill_section(width, height),
+        accent_section(),
+    ))
+
+
+def build_hw1_svg(out_path: str | Path = OUT_PATH, width: int = W, height: int = H) -> None:
+    # The scene shipped with the hw1 write-up (docs/competition.svg), built from
+    # the same pieces as build_svg() at the write-up's original precision:
+    # - sky: four large triangles forming a two-tone gradient
+    # - spiral: 7 arms x 24 wedges, two turns each, arms spread around the
+    #   center with colors cycling across arms (geometric antialiasing)
+    # - diamonds: 4 triangles each, odd rows offset, shade by (row + col),
+    #   covering the top 70% of the canvas (more thin edges)
+    # - panels: three quads, two textris each, over different uv windows of
+    #   the same texture (texture antialiasing)
+    # - hills: three layered many-vertex polygons the parser triangulates,
+    #   then the foreground accent triangles
+    _write(out_path, DOCUMENT % (width, height, width, height, *hw1_sections(width, height)))
+
+
+def main() -> None:
+    build_svg(OUT_PATH)
     print(f"Wrote {OUT_PATH}")
 
 